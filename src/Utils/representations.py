@@ -1,4 +1,7 @@
 from typing import TYPE_CHECKING
+from functools import cached_property, lru_cache
+from operator import attrgetter
+from collections import deque
 
 # region custom imports
 if TYPE_CHECKING:
@@ -7,46 +10,239 @@ if TYPE_CHECKING:
     from adts.positional_list_adt import PositionalListADT
     from user_defined_types.generic_types import T
 
-from ds.primitives.Positional_Lists.positional_list_utils import PositionalListUtils
 from ds.primitives.Linked_Lists.linked_list_utils import LinkedListUtils
 from utils.helpers import Ansi
 from utils.constants import SLL_SEPERATOR
 # endregion
 
+# region markers
+# constant colored markers - built once at import instead of on every render.
+_FRONT_MARKER = Ansi.color("(F)", Ansi.GREEN)
+_REAR_MARKER = Ansi.color("(R)", Ansi.GREEN)
+# colored placeholders for missing values (no parent / child, empty stack)
+_GREEN_NONE = Ansi.color("None", Ansi.GREEN)
+_RED_NONE = Ansi.color("None", Ansi.RED)
+# tree node status fragments - a node is only ever alive or deleted.
+_ALIVE_STATUS = f"[status={Ansi.color('alive', Ansi.GREEN)}]"
+_DELETED_STATUS = f"[status={Ansi.color('deleted', Ansi.RED)}]"
+# tree render titles
+_GEN_TREE_TITLE = Ansi.color("Tree: Depth First Search (DFS):", Ansi.GREEN)
+_BINARY_TREE_TITLE = Ansi.color("Tree: Depth First Search (DFS):🌲", Ansi.GREEN)
+_BST_TITLE = Ansi.color("Binary Search Tree: Inorder Traversal:🌲", Ansi.GREEN)
+_AVL_TITLE = Ansi.color("AVL Tree: 🌲", Ansi.GREEN)
+_RED_BLACK_TITLE = Ansi.color("Red Black Tree: ", Ansi.RED)
+_TRIE_TITLE = Ansi.color("Trie:", Ansi.YELLOW)
+_SEGMENT_TREE_TITLE = Ansi.color("Segment Tree:🌲", Ansi.BLUE)
+# endregion
+
+# region connectors
+# tree drawing pieces - indexed by is_last (False, True) instead of a per-node ternary.
+_INDICATORS = ("├─", "└─")
+_BST_INDICATORS = ("├─ ", "└─ ")
+_CHILD_PREFIXES = ("│  ", "   ")
+_TRIE_CHILD_PREFIXES = ("|  ", "  ")
+_SEGMENT_CONNECTORS = ("└──", "├──")  # indexed by is_left - the left child is never the last one drawn
+# full connector tables - indexed [is_leaf][is_last], so a node's connector is one lookup with no branching.
+_BINARY_CONNECTORS = (_INDICATORS, _INDICATORS)
+_BST_CONNECTORS = (_BST_INDICATORS, ("└─ ", "└─ "))  # bst leaves always use the "last child" connector
+# endregion
+
+# fetches (element, next) from a linked list node in one C-level call.
+_ELEMENT_NEXT = attrgetter("_element", "next")
+
+
+def _owner_tag(instance) -> str:
+    """owner fragment for nodes & positions - only the owner's class name and address, never the owner's own repr."""
+    return f"[Owner: {type(instance).__name__}: {hex(id(instance))}]"
+
+def _circular_span(array, front: int, size: int, capacity: int) -> list:
+    """occupied slots of a circular buffer in logical order - at most two contiguous slices, no per-element modulo."""
+    end = front + size
+    if end <= capacity:
+        return list(array[front:end])
+    values = list(array[front:capacity])
+    values.extend(array[0:end - capacity])
+    return values
+
+def _color_ends(values, wrap_single_twice: bool = False) -> str:
+    """queue / deque items as "[a, b, c]" - the front (first) & rear (last) items are colored green, the middle stays plain.
+    a single item is both ends: colored once, or once per role when wrap_single_twice is set."""
+    items = list(map(str, values))
+    if items:
+        color, green = Ansi.color, Ansi.GREEN
+        items[0] = color(items[0], green)
+        if wrap_single_twice or len(items) > 1:
+            items[-1] = color(items[-1], green)
+    return f"[{', '.join(items)}]"
+
+def _priority_entries(pqueue) -> list:
+    """renders each [priority]: element pair of a priority queue / heap, coloring the priority element in green."""
+    # .priority is a find_min / find_max scan - fetch it once per render, not once per entry.
+    extreme = pqueue.priority
+    items = []
+    append = items.append
+    for priority, element in pqueue._data.array[0:pqueue.pqueue_size]:
+        # equality (not position) decides - every entry holding the priority element is highlighted, duplicates included.
+        if element == extreme:
+            append(Ansi.color(f"[{priority}]: {element}", Ansi.GREEN))
+        else:
+            append(f"[{priority}]: {element}")
+    return items
+
+# default key labels for the min max stack - checked in order, first matching base class wins.
+_KEY_LABELS = (
+    ((int, float), "Numeric"),
+    ((list, dict, set), "Count Elements"),
+    ((str, tuple), "Lexographic"),
+    (complex, "Complex Numeric"),
+)
+
+@lru_cache(maxsize=None)
+def _key_label(datatype: type) -> str:
+    """default key label for a datatype - resolved once per type."""
+    for types, label in _KEY_LABELS:
+        if issubclass(datatype, types):
+            return label
+    return "None"
+
+def _element_label(node) -> str:
+    """binary tree node label - just the element. formatted inline, no str() call - the common str element is passed straight through."""
+    return f"{node.element}"
+
+def _key_element_label(node) -> str:
+    """bst node label - "key: element"."""
+    return f"{node.key}: {node.element}"
+
+def _red_black_label(node) -> str:
+    """red black node label - "key: element (r/b)". never cached: recolouring does not touch the node's key or element."""
+    return f"{node.key}: {node.element} ({f'r' if node.is_red else 'b'})"
+
+def _iter_binary_lines(root, node_label, connectors, nil=None, root_indicator: str = ""):
+    """lazily yields (depth, prefix, indicator, label) for every node of a binary tree in render order.
+    nil is the empty-child marker (None, or a tree's sentinel) - nil children are never yielded."""
+    # root (depth = 0) is emitted up front - the loop below only ever sees descendants.
+    yield 0, "", root_indicator, node_label(root)
+    child_prefixes = _CHILD_PREFIXES
+    root_prefix = child_prefixes[True]
+
+    tree = deque()  # (node, prefix, is_last, depth) - used as a stack
+    # stack methods & connector tables bound once - the loop body runs on locals only.
+    pop, push = tree.pop, tree.append
+    if root.right is not nil:
+        push((root.right, root_prefix, True, 1))
+    if root.left is not nil:
+        push((root.left, root_prefix, False, 1))
+
+    while tree:
+        # we traverse depth-first, which naturally fits a hierarchical print.
+        node, prefix, is_last, depth = pop()
+
+        # single-child chains are followed right here - the only child would be popped straight back off the stack anyway.
+        while True:
+            right, left = node.right, node.left
+            is_leaf = right is nil and left is nil
+
+            # connector symbol comes straight from the table - only the root has an empty prefix, and it never reaches this loop.
+            yield depth, prefix, connectors[is_leaf][is_last], node_label(node)
+
+            # leaves have nothing to pass a prefix down to - skip building one.
+            if is_leaf:
+                break
+
+            # Build prefix for children - Vertical bars "│" are inherited from ancestors that are not last children
+            prefix = prefix + child_prefixes[is_last]
+            depth += 1
+
+            # right is always the last child - a lone left child still draws as a middle one.
+            if left is nil:
+                node, is_last = right, True
+            elif right is nil:
+                node, is_last = left, False
+            else:
+                # pushed straight onto the stack - right first so left pops first.
+                push((right, prefix, True, depth))
+                push((left, prefix, False, depth))
+                break
+
+def _render_dfs(lines, title: str, extra_stats: str = "") -> str:
+    """consumes (depth, prefix, indicator, label) lines into the final tree string - node count & height are tallied on the way."""
+    # slot 0 is reserved for the header (its stats are only known after the walk) - the whole output is built by one join.
+    parts = [None]
+    write = parts.extend
+    total_tree_nodes = 0
+    tree_height = 0
+    for depth, prefix, indicator, label in lines:
+        total_tree_nodes += 1
+        if depth > tree_height:
+            tree_height = depth
+        write((prefix, indicator, label, "\n"))
+
+    parts[0] = f"\n{title}\n[total_nodes={total_tree_nodes}][height={tree_height}]{extra_stats}\n"
+    return "".join(parts)
+
+def _count_and_height(root, nil=None) -> tuple:
+    """(node count, edge-based height) of a binary tree from one walk - replaces a separate len() and height() traversal."""
+    if root is nil:
+        return 0, 0
+    tree = deque([(root, 0)])  # (node, depth) - used as a stack
+    pop, push = tree.pop, tree.append
+    total_tree_nodes = 0
+    tree_height = 0
+    while tree:
+        node, depth = pop()
+        total_tree_nodes += 1
+        if depth > tree_height:
+            tree_height = depth
+        right, left = node.right, node.left
+        if right is not nil:
+            push((right, depth + 1))
+        if left is not nil:
+            push((left, depth + 1))
+    return total_tree_nodes, tree_height
+
 
 # where we add console visualizations for the different data structure types - usually use these in __str__ or __repr__ or a utility function.
 class BaseRepr:
     """Holds all the common descriptors that are used by every representation."""
     def __init__(self, obj) -> None:
         self.obj = obj
-        self._ansi = Ansi()
+        # class name & memory address never change for a given object.
+        self._qualname = type(obj).__qualname__
+        self._address = hex(id(obj))
 
-    @property
+    @cached_property
+    def _datatype_name(self) -> str:
+        """resolved on first use - some structures compose their repr before setting the datatype."""
+        return self.obj.datatype.__name__
+
+    # identity descriptors never change for a given object - built on first render, then reused.
+    @cached_property
     def ds_class(self):
-        return f"[{self.obj.__class__.__qualname__}]"
+        return f"[{self._qualname}]"
 
-    @property
+    @cached_property
     def ds_memory_address(self):
-        return f"[{self.obj.__class__.__qualname__}: {hex(id(self.obj))}]"
+        return f"[{self._qualname}: {self._address}]"
 
-    @property
+    @cached_property
     def ds_datatype(self):
-        return f"[Type: {self.obj.datatype.__name__}]"
+        return f"[Type: {self._datatype_name}]"
 
 class UntypedBaseRepr:
     """Holds all the common descriptors that are used by every representation."""
 
     def __init__(self, obj) -> None:
         self.obj = obj
-        self._ansi = Ansi()
+        self._qualname = type(obj).__qualname__
+        self._address = hex(id(obj))
 
-    @property
+    @cached_property
     def ds_class(self):
-        return f"[{self.obj.__class__.__qualname__}]"
+        return f"[{self._qualname}]"
 
-    @property
+    @cached_property
     def ds_memory_address(self):
-        return f"[{self.obj.__class__.__qualname__}: {hex(id(self.obj))}]"
+        return f"[{self._qualname}: {self._address}]"
 
 
 # region arrays
@@ -54,15 +250,17 @@ class ArrayRepr(BaseRepr):
     """Representation for arrays and base class for array type structures."""
     @property
     def items(self) -> str:
-        return f"[{', '.join(str(self.obj.array[i]) for i in range(self.obj.size))}]"
+        array = self.obj.array
+        return f"[{', '.join(map(str, array[0:self.obj.size]))}]"
     
     @property
     def storage(self) -> str:
         return f"[{self.obj.size}/{self.obj.capacity}]"
     
-    @property
+    @cached_property
     def array_type(self) -> str:
-        return f"[{'Static' if self.obj.is_static == True else 'Dynamic'}]"
+        """an array is built static or dynamic & never switches - the label is worked out once."""
+        return "[Static]" if self.obj.is_static else "[Dynamic]"
     
 
     def str_array(self):
@@ -82,7 +280,7 @@ class ViewRepr(ArrayRepr):
 
     @property
     def view_items(self) -> str:
-        return f"[{', '.join(str(self.obj[i]) for i in range(self.obj._length))}]"
+        return f"[{', '.join(map(str, self.obj))}]"
 
     def str_view(self):
         """ __str__ for array views (similar to slices in python without the copying)"""
@@ -97,11 +295,8 @@ class SortedArrayRepr(ArrayRepr):
 
     @property
     def items(self) -> str:
-        return f"[{', '.join(str(self.obj.array[i].value) for i in range(self.obj.size))}]"
-
-    @property
-    def array_type(self) -> str:
-        return f"[{'Static' if self.obj.is_static == True else 'Dynamic'}]"
+        array = self.obj.array
+        return f"[{', '.join([str(key.value) for key in array[0:self.obj.size]])}]"
 
 
     def repr_array(self):
@@ -120,7 +315,7 @@ class SllNodeRepr(UntypedBaseRepr):
 
     @property
     def next_pointer(self) -> str:
-        return f"[Nxt: {str(self.obj.next)}]"
+        return f"[Nxt: {self.obj.next}]"
 
     @property
     def alive(self) -> str:
@@ -128,13 +323,10 @@ class SllNodeRepr(UntypedBaseRepr):
 
     @property
     def owner(self) -> str:
-        instance = self.obj.list_owner
-        owner_name = type(instance).__name__
-        memory_address = hex(id(instance))
-        return f"[Owner: {owner_name}: {memory_address}]"
+        return _owner_tag(self.obj.list_owner)
 
     def str_ll_node(self):
-        return f"{self.node_element}"
+        return self.node_element
 
     def repr_sll_node(self):
         return f"{self.ds_memory_address}: {self.node_element}, {self.next_pointer}{self.alive}{self.owner}"
@@ -144,10 +336,10 @@ class DllNodeRepr(SllNodeRepr):
 
     @property
     def prev_pointer(self) -> str:
-        return f"[Prv: {str(self.obj.prev)}]"
+        return f"[Prv: {self.obj.prev}]"
 
     def str_ll_node(self):
-        return f"{self.node_element}"
+        return self.node_element
 
     def repr_dll_node(self):
         return f"{self.ds_memory_address}: {self.node_element}, {self.next_pointer}{self.prev_pointer}{self.alive}{self.owner}"
@@ -159,31 +351,36 @@ class LinkedListRepr(BaseRepr):
     def total_nodes(self) -> str:
         return f"[{self.obj.total_nodes}]"
 
-    @property
-    def simple_traversal(self):
-        """traverses the nodes and returns a string via generator"""
-        current_node = self.obj._head
-        while current_node:
-            yield str(current_node._element)
-            current_node = current_node.next
-            # exit condition for DCLL
-            if current_node is self.obj._head:
-                break
-
-    @property
-    def head_symbol(self) -> str:
-        return f"(H)"
+    def _collect_elements(self) -> list:
+        """traverses the nodes and returns a list of the raw elements - formatting is left to the caller (map(str, ...) runs in C)."""
+        elements = []
+        append = elements.append
+        head = self.obj._head
+        tail = self.obj._tail
+        current_node = head
+        # circular lists link the tail back to the head - decided once, so the plain walk needs no sentinel check.
+        if tail is not None and tail.next is head:
+            while True:
+                element, current_node = _ELEMENT_NEXT(current_node)
+                append(element)
+                # exit condition for DCLL
+                if current_node is head:
+                    break
+        else:
+            while current_node:
+                element, current_node = _ELEMENT_NEXT(current_node)
+                append(element)
+        return elements
 
-    @property
-    def tail_symbol(self) -> str:
-        return f"(T)"
+    head_symbol = "(H)"
+    tail_symbol = "(T)"
 
     def str_ll(self, sep: str = SLL_SEPERATOR):
         """Displays all the content of the linked list as a string."""
         # empty ll case:
-        if self.obj._head is None: return f"{self.ds_class}{self.ds_datatype}{self.total_nodes}"
-        infostring = f"{self.ds_class}{self.total_nodes}: {self.head_symbol} {sep.join(self.simple_traversal)} {self.tail_symbol}"
-        return infostring
+        obj = self.obj
+        if obj._head is None: return f"{self.ds_class}{self.ds_datatype}{self.total_nodes}"
+        return f"{self.ds_class}{self.total_nodes}: {self.head_symbol} {sep.join(map(str, self._collect_elements()))} {self.tail_symbol}"
 
     def repr_ll(self):
         """Displays the memory address and other useful info"""
@@ -200,14 +397,14 @@ class PNodeRepr(UntypedBaseRepr):
 
     @property
     def prev_pointer(self) -> str:
-        return f"[Prv: {str(self.obj.prev)}]"
+        return f"[Prv: {self.obj.prev}]"
 
     @property
     def next_pointer(self) -> str:
-        return f"[Nxt: {str(self.obj.next)}]"
+        return f"[Nxt: {self.obj.next}]"
 
     def str_p_node(self):
-        return f"{self.node_element}"
+        return self.node_element
 
     def repr_p_node(self):
         return f"{self.ds_memory_address}: {self.node_element}, {self.next_pointer}{self.prev_pointer}"
@@ -217,56 +414,60 @@ class PositionRepr(UntypedBaseRepr):
 
     @property
     def owner(self) -> str:
-        instance = self.obj.container
-        owner_name = type(instance).__name__
-        memory_address = hex(id(instance))
-        return f"[Owner: {owner_name}: {memory_address}]"
+        return _owner_tag(self.obj.container)
 
     @property
     def position_element(self) -> str:
         return f"{self.obj.element}"
 
     def str_position(self):
-        return f"{self.position_element}"
+        return self.position_element
 
     def repr_position(self):
         return f"{self.ds_memory_address}: elem = {self.position_element}, {self.owner}"
 
 class PlistRepr(BaseRepr):
     """Representations for the actual position list itself."""
-    def __init__(self, obj) -> None:
-        super().__init__(obj)
-        self._utils = PositionalListUtils(self.obj)
 
     @property
     def total_nodes(self) -> str:
         return f"[{self.obj.total_nodes}]"
 
-    @property
-    def head_symbol(self) -> str:
-        return f"(H)"
+    def _collect_elements(self) -> list:
+        """walks the nodes between the sentinels and returns a list of the raw elements - no Position built or validated per node."""
+        elements = []
+        append = elements.append
+        trailer = self.obj._trailer
+        current_node = self.obj._header.next
+        while current_node is not trailer:
+            append(current_node._element)
+            current_node = current_node._next
+        return elements
 
-    @property
-    def tail_symbol(self) -> str:
-        return f"(T)"
+    head_symbol = "(H)"
+    tail_symbol = "(T)"
 
     @property
     def head(self) -> str:
         position = self.obj.head
-        position = None if position is None else self.obj.head.element
-        return f"[Head = {position}]"
+        return f"[Head = {None if position is None else position.element}]"
 
     @property
     def tail(self) -> str:
         position = self.obj.tail
-        position = None if position is None else self.obj.tail.element
-        return f"[Tail = {position}]"
+        return f"[Tail = {None if position is None else position.element}]"
+
+    @cached_property
+    def _empty_str(self) -> str:
+        """__str__ of the empty list - is_empty() means a zero node count, so the string is fixed once built."""
+        return f"{self.ds_class}[0]"
 
     def str_positional_list(self, sep: str = SLL_SEPERATOR):
         """Displays all the content of the linked list as a string."""    
-        if self.obj.first() is None: return f"{self.ds_class}{self.total_nodes}"
-        infostring = f"{self.ds_class}{self.total_nodes}: {self.head_symbol} {sep.join(self._utils.positional_list_traversal())} {self.tail_symbol}"
-        return infostring
+        # is_empty reads the node count - first() would build a throwaway Position just for the None check.
+        obj = self.obj
+        if obj.is_empty(): return self._empty_str
+        return f"{self.ds_class}{self.total_nodes}: {self.head_symbol} {sep.join(self._collect_elements())} {self.tail_symbol}"
 
     def repr_positional_list(self):
         """Displays the memory address and other useful info"""
@@ -279,20 +480,15 @@ class LlStackRepr(LinkedListRepr):
     def __init__(self, obj) -> None:
         super().__init__(obj)
 
-    @property
-    def top_symbol(self) -> str:
-        return self._ansi.color(f"(Top)", Ansi.GREEN)
-
     @property
     def top_element(self) -> str:
         top = self.obj.top
-        color_top = self._ansi.color(f"{top}", Ansi.GREEN)
+        color_top = Ansi.color(top, Ansi.GREEN)
         return f"[Top={color_top}]"
     
     @property
     def elements(self) -> str:
-        elements = (str(element) for element in self.obj)
-        return f"[{', '.join(elements)}]"
+        return f"[{', '.join(map(str, self.obj))}]"
 
     def str_ll_stack(self) -> str:
         """Stack __str__ representation"""
@@ -308,16 +504,18 @@ class ArrayStackRepr(ArrayRepr):
 
     @property
     def top_element(self) -> str:
-        top = self.obj.data.array[self.obj.top]
-        color_top = self._ansi.color(f"{top}", Ansi.GREEN)
-        if self.obj.is_empty(): color_top = self._ansi.color(f"None", Ansi.GREEN)
-        return f"[Top={color_top}]"
+        # empty stacks have top == -1 - check first so repr never reads an unset slot.
+        if self.obj.is_empty():
+            top = "None"
+        else:
+            top = self.obj.data.array[self.obj.top]
+        return f"[Top={Ansi.color(top, Ansi.GREEN)}]"
 
     @property
     def elements(self) -> str:
-        elements = (str(element) for element in self.obj)
-        elements_string = f"[{', '.join(elements)}]"
-        return elements_string
+        # the filled slots are sliced off the backing array in one call - no generator step per element.
+        obj = self.obj
+        return f"[{', '.join(map(str, obj.data.array[0:obj.size]))}]"
 
     @property
     def storage(self) -> str:
@@ -325,9 +523,14 @@ class ArrayStackRepr(ArrayRepr):
         array_capacity = self.obj.data.capacity
         return f"[{number_of_elems}/{array_capacity}]"
 
+    @cached_property
+    def _empty_str(self) -> str:
+        """__str__ of the empty stack - it carries no counts, so it is built once."""
+        return f"{self.ds_class}: []"
+
     def str_array_stack(self) -> str:
         """Stack __str__ representation"""
-        if self.obj.is_empty(): return f"{self.ds_class}: []"
+        if self.obj.is_empty(): return self._empty_str
         return f"{self.ds_class}{self.storage}: {self.top_element}{self.elements}"
 
     def repr_array_stack(self) -> str:
@@ -340,43 +543,27 @@ class MinMaxStackRepr(ArrayStackRepr):
     @property
     def min(self)->str:
         min = self.obj.min
-        color_min = self._ansi.color(f"{min}", Ansi.GREEN)
-        if self.obj.is_empty():
-            color_min = self._ansi.color(f"None", Ansi.GREEN)
+        color_min = _GREEN_NONE if self.obj.is_empty() else Ansi.color(min, Ansi.GREEN)
         return f"[Min={color_min}]"
 
     @property
     def max(self)->str:
         max = self.obj.max
-        color_max = self._ansi.color(f"{max}", Ansi.RED)
-        if self.obj.is_empty():
-            color_max = self._ansi.color(f"None", Ansi.RED)
+        color_max = _RED_NONE if self.obj.is_empty() else Ansi.color(max, Ansi.RED)
         return f"[Max={color_max}]"
 
     @property
     def average(self)->str:
         avg = self.obj.average
-        color_avg = self._ansi.color(f"{avg}", Ansi.YELLOW)
+        color_avg = Ansi.color(avg, Ansi.YELLOW)
         return f"Avg={color_avg}]"
 
     @property
     def key(self)->str:
         """Potentially use later - fill with default and custom"""
-        numeric = lambda x: x
-        count = lambda x: len(x)
-        lexographic = lambda x: len(x)
-        key = "None"
-        if self.obj.key is None and issubclass(self.obj.datatype, (int, float)):
-            key = "Numeric"
-        elif self.obj.key is None and issubclass(self.obj.datatype, (list, dict, set)):
-            key = "Count Elements"
-        elif self.obj.key is None and issubclass(self.obj.datatype, (str, tuple)):
-            key = "Lexographic"
-        elif self.obj.key is None and issubclass(self.obj.datatype, complex):
-            key = "Complex Numeric"
-        elif self.obj.key is not None:
-            key = "Custom"
-        return f"[Key={key}]"
+        if self.obj.key is not None:
+            return "[Key=Custom]"
+        return f"[Key={_key_label(self.obj.datatype)}]"
 
     def str_min_max_avg_stack(self) -> str:
         """representation for the min max stack."""
@@ -392,40 +579,30 @@ class MinMaxStackRepr(ArrayStackRepr):
 class llQueueRepr(LinkedListRepr):
     """Linked list queue representation """
 
-    @property
-    def front_marker(self):
-        return self._ansi.color(f"(F)", Ansi.GREEN)
-
-    @property
-    def rear_marker(self):
-        return self._ansi.color(f"(R)", Ansi.GREEN)
+    front_marker = _FRONT_MARKER
+    rear_marker = _REAR_MARKER
 
     @property
     def elements(self):
-        def generate_elements():
-            current_node = self.obj.linkedlist.head
-            while current_node:
-                value = str(current_node.element)
-                if current_node is self.obj.linkedlist.head:
-                    value = self._ansi.color(value, Ansi.GREEN)
-                if current_node is self.obj.linkedlist.tail:
-                    value = self._ansi.color(value, Ansi.GREEN)
-                yield value
-                current_node = current_node.next
-
-        elements_string = f"[{', '.join(generate_elements())}]"
-        return elements_string
+        raw = []
+        append = raw.append
+        current_node = self.obj.linkedlist.head
+        while current_node:
+            element, current_node = _ELEMENT_NEXT(current_node)
+            append(element)
+        # the linked queue has always wrapped a lone node twice.
+        return _color_ends(raw, wrap_single_twice=True)
 
     @property
     def front_element(self) -> str:
         front = self.obj.front
-        front_color = self._ansi.color(f"{front}", Ansi.GREEN)
+        front_color = Ansi.color(front, Ansi.GREEN)
         return f"[Front={front_color}]"
 
     @property
     def rear_element(self) -> str:
         rear = self.obj.rear
-        rear_color = self._ansi.color(f"{rear}", Ansi.GREEN)
+        rear_color = Ansi.color(rear, Ansi.GREEN)
         return f"[Rear={rear_color}]"
 
     @property
@@ -449,15 +626,8 @@ class CircArrayQueueRepr(BaseRepr):
     def storage(self):
         return f"[{self.obj.queue_size}/{self.obj._capacity}]"
 
-    @property
-    def front_marker(self):
-        color_front = self._ansi.color(f"(F)", Ansi.GREEN)
-        return f"{color_front}"
-
-    @property
-    def rear_marker(self):
-        color_rear = self._ansi.color(f"(R)", Ansi.GREEN)
-        return f"{color_rear}"
+    front_marker = _FRONT_MARKER
+    rear_marker = _REAR_MARKER
 
     @property
     def buffer_type(self):
@@ -469,29 +639,20 @@ class CircArrayQueueRepr(BaseRepr):
     @property
     def front_element(self):
         front = self.obj.front
-        color_front = self._ansi.color(f"{front}", Ansi.GREEN)
+        color_front = Ansi.color(front, Ansi.GREEN)
         return f"[Front={color_front}]"
 
     @property
     def rear_element(self):
         rear = self.obj.rear
-        color_rear = self._ansi.color(f"{rear}", Ansi.GREEN)
+        color_rear = Ansi.color(rear, Ansi.GREEN)
         return f"[Rear={color_rear}]"
 
     @property
     def elements(self):
-        def _element_generator(color=Ansi.GREEN):
-            """colors the front and rear in a specified color"""
-            for i in range(self.obj.queue_size):
-                index = (self.obj._front + i) % self.obj._capacity
-                value = self.obj._buffer.array[index]
-
-                if value in (self.obj.front, self.obj.rear):
-                    yield self._ansi.color(f"{value}", color)
-                else:
-                    yield str(value)
-        elements = f"[{', '.join(_element_generator())}]"
-        return elements
+        """colors the front and rear in green"""
+        obj = self.obj
+        return _color_ends(_circular_span(obj._buffer.array, obj._front, obj.queue_size, obj._capacity))
 
     def str_circ_array_queue(self):
         if self.obj.is_empty():
@@ -511,43 +672,26 @@ class CircDequeRepr(BaseRepr):
     def storage(self):
         return f"[{self.obj.deque_size}/{self.obj.deque_capacity}]"
 
-    @property
-    def front_marker(self):
-        color_front = self._ansi.color(f"(F)", Ansi.GREEN)
-        return f"{color_front}"
-
-    @property
-    def rear_marker(self):
-        color_rear = self._ansi.color(f"(R)", Ansi.GREEN)
-        return f"{color_rear}"
+    front_marker = _FRONT_MARKER
+    rear_marker = _REAR_MARKER
 
     @property
     def front_element(self):
         front = self.obj.front
-        color_front = self._ansi.color(f"{front}", Ansi.GREEN)
+        color_front = Ansi.color(front, Ansi.GREEN)
         return f"[Front={color_front}]"
 
     @property
     def rear_element(self):
         rear = self.obj.rear
-        color_rear = self._ansi.color(f"{rear}", Ansi.GREEN)
+        color_rear = Ansi.color(rear, Ansi.GREEN)
         return f"[Rear={color_rear}]"
 
     @property
     def elements(self):
-        def _element_generator(color=Ansi.GREEN):
-            """colors the front and rear in a specified color"""
-            for i in range(self.obj.deque_size):
-                index = (self.obj._front + i) % self.obj.deque_capacity
-                value = self.obj._buffer.array[index]
-
-                if value in (self.obj.front, self.obj.rear):
-                    yield self._ansi.color(f"{value}", color)
-                else:
-                    yield str(value)
-
-        elements = f"[{', '.join(_element_generator())}]"
-        return elements
+        """colors the front and rear in green"""
+        obj = self.obj
+        return _color_ends(_circular_span(obj._buffer.array, obj._front, obj.deque_size, obj.deque_capacity))
 
     def str_circ_deque(self):
         if self.obj.is_empty(): return f"{self.ds_class}{self.storage}: []"
@@ -561,26 +705,19 @@ class CircDequeRepr(BaseRepr):
 
 class LlDequeRepr(LinkedListRepr):
     """Linked lIst console visualization"""
-    @property
-    def front_marker(self):
-        color_front = self._ansi.color(f"(F)", Ansi.GREEN)
-        return f"{color_front}"
-
-    @property
-    def rear_marker(self):
-        color_rear = self._ansi.color(f"(R)", Ansi.GREEN)
-        return f"{color_rear}"
+    front_marker = _FRONT_MARKER
+    rear_marker = _REAR_MARKER
 
     @property
     def front_element(self):
         front = self.obj.front
-        color_front = self._ansi.color(f"{front}", Ansi.GREEN)
+        color_front = Ansi.color(front, Ansi.GREEN)
         return f"[Front={color_front}]"
 
     @property
     def rear_element(self):
         rear = self.obj.rear
-        color_rear = self._ansi.color(f"{rear}", Ansi.GREEN)
+        color_rear = Ansi.color(rear, Ansi.GREEN)
         return f"[Rear={color_rear}]"
 
     @property
@@ -590,34 +727,24 @@ class LlDequeRepr(LinkedListRepr):
 
     @property
     def elements(self):
-        def _element_generator():
-            """colors the front and rear in a specified color"""
-            current_node = self.obj._dll.head
-            while current_node:
-                element = current_node.element
-                if element == self.obj.front:
-                    yield self._ansi.color(f"{element}", Ansi.GREEN)
-                elif element == self.obj.rear:
-                    yield self._ansi.color(f"{element}", Ansi.GREEN)
-                else:
-                    yield str(current_node.element)
-                current_node = current_node.next    # traverse
-
-        elements = f"[{', '.join(_element_generator())}]"
-        return elements
+        """colors the front and rear in green"""
+        items = []
+        append = items.append
+        current_node = self.obj._dll.head
+        while current_node:
+            element, current_node = _ELEMENT_NEXT(current_node)    # traverse
+            append(element)
+        return _color_ends(items)
 
     def dll_str_deque(self):
-
         if self.obj.is_empty():
             return f"{self.ds_class}{self.total_nodes}: []"
         return f"{self.ds_class}{self.total_nodes}: {self.front_marker}{self.elements}{self.rear_marker}"
 
     def dll_repr_deque(self):
         """Displays the memory address and other useful info"""
-
         if self.obj.is_empty():
             return f"{self.ds_memory_address}{self.ds_datatype}{self.total_nodes}"
-
         return f"{self.ds_memory_address}{self.ds_datatype}{self.total_nodes}{self.front_element}{self.rear_element}"
 # endregion
 
@@ -626,7 +753,7 @@ class PQueueRepr(BaseRepr):
 
     @property
     def priority_element(self) -> str:
-        priority = self._ansi.color(f"{self.obj.priority}", Ansi.GREEN)
+        priority = Ansi.color(self.obj.priority, Ansi.GREEN)
         return f"[Priority={priority}]"
 
     @property
@@ -641,17 +768,7 @@ class PQueueRepr(BaseRepr):
 
     @property
     def elements(self) -> str:
-        def _generate_items():
-            for i in range(self.obj.pqueue_size):
-                kv_pair = self.obj._data.array[i]
-                priority, element = kv_pair
-                # color priority element
-                if element == self.obj.priority:
-                    yield self._ansi.color(f"[{priority}]: {element}", Ansi.GREEN)
-                else:
-                    yield f"[{priority}]: {element}"
-        elements = f"[{', '.join(_generate_items())}]"
-        return elements
+        return f"[{', '.join(_priority_entries(self.obj))}]"
 
     def str_simple_pq(self):
         if self.obj.is_empty():
@@ -667,19 +784,19 @@ class PQueueRepr(BaseRepr):
 # heaps
 class BinaryHeapRepr(BaseRepr):
 
-    @property
+    @cached_property
     def heap_type(self):
         """boolean for min or max heap - info for __str__"""
         if self.obj.heap_type:
-            color_heap_type = self._ansi.color(f"Min Heap",Ansi.RED)
+            color_heap_type = Ansi.color("Min Heap", Ansi.RED)
             return f"[Heap_Type={color_heap_type}]"
         else:
-            color_heap_type = self._ansi.color(f"Max Heap",Ansi.RED)
+            color_heap_type = Ansi.color("Max Heap", Ansi.RED)
             return f"[HeapType={color_heap_type}]"
 
     @property
     def priority_element(self) -> str:
-        priority = self._ansi.color(f"{self.obj.priority}", Ansi.GREEN)
+        priority = Ansi.color(self.obj.priority, Ansi.GREEN)
         return f"[Priority={priority}]"
 
     @property
@@ -694,18 +811,7 @@ class BinaryHeapRepr(BaseRepr):
 
     @property
     def elements(self) -> str:
-        def _generate_items():
-            for i in range(self.obj.pqueue_size):
-                kv_pair = self.obj._data.array[i]
-                priority, element = kv_pair
-                # color priority element
-                if element == self.obj.priority:
-                    yield self._ansi.color(f"[{priority}]: {element}", Ansi.GREEN)
-                else:
-                    yield f"[{priority}]: {element}"
-
-        elements = f"[{', '.join(_generate_items())}]"
-        return elements
+        return f"[{', '.join(_priority_entries(self.obj))}]"
 
     def str_heap(self):
         # empty case:
@@ -715,7 +821,6 @@ class BinaryHeapRepr(BaseRepr):
 
     def repr_heap(self):
         """Displays the memory address and other useful info"""
-
         if self.obj.is_empty():
             return f"{self.ds_memory_address}{self.ds_datatype}{self.storage}{self.heap_type}"
         return f"{self.ds_memory_address}{self.ds_datatype}{self.storage}{self.priority_element}{self.keytype}{self.heap_type}"
@@ -723,10 +828,10 @@ class BinaryHeapRepr(BaseRepr):
 class FibonacciHeapRepr(BaseRepr):
 
     def str_fibonacci_heap(self):
-        return f"{self.ds_class}"
+        return self.ds_class
     
     def repr_fibonacci_heap(self):
-        return f"{self.ds_memory_address}"
+        return self.ds_memory_address
     
 
 # endregion
@@ -739,26 +844,24 @@ class OAHashTableRepr(BaseRepr):
         return f"[{self.obj.datatype_string}]"
 
     def str_oa_hashtable(self):
-        return f"{self.ds_class}{self.obj.capacity_string}: {self.obj.table_items}"
+        obj = self.obj
+        return f"{self.ds_class}{obj.capacity_string}: {obj.table_items}"
 
     def repr_oa_hashtable(self):
-        stats = f"{self.ds_memory_address}{self.datatype}{self.obj.capacity_string}[{self.obj.loadfactor_string}, {self.obj.probes_string}, {self.obj.tombstone_string}, {self.obj.total_collisions_string}, {self.obj.rehashes_string}, {self.obj.avg_probes_string}]"
-        return stats
+        obj = self.obj
+        return f"{self.ds_memory_address}[{obj.datatype_string}]{obj.capacity_string}[{obj.loadfactor_string}, {obj.probes_string}, {obj.tombstone_string}, {obj.total_collisions_string}, {obj.rehashes_string}, {obj.avg_probes_string}]"
 
 class ChainHashTableRepr(BaseRepr):
 
     # todo refactor - add OA - type strings (for icons for repr.)
 
     def str_chain_hashtable(self):
-        items = self.obj.items()
-        infostring = f"[{self.obj.datatype.__name__}]{{{{{str(', '.join(f'{k}: {v}' for k, v in items))}}}}}"
-        return infostring
+        entries = ', '.join([f"{k}: {v}" for k, v in self.obj.items()])
+        return f"[{self._datatype_name}]{{{{{entries}}}}}"
 
     def repr_chain_hashtable(self):
-        class_address = (f"<{self.obj.__class__.__qualname__} object at {hex(id(self.obj))}>")
-        datatype = self.obj.datatype.__name__
-        capacity = f"{self.obj.total_elements}/{self.obj.table_capacity}"
-        return f"{class_address}, Type: {datatype}, Capacity: {capacity}"
+        obj = self.obj
+        return f"<{self._qualname} object at {self._address}>, Type: {self._datatype_name}, Capacity: {obj.total_elements}/{obj.table_capacity}"
 
 class SkipNodeRepr(BaseRepr):
     """for Specialized Skip List Nodes"""
@@ -816,7 +919,7 @@ class HashSetRepr(BaseRepr):
 
     @property
     def elements(self) -> str:
-        return f"{{{f', '.join(str(i) for i in self.obj.members)}}}"
+        return f"{{{f', '.join(map(str, self.obj.members))}}}"
 
     def str_hashset(self):
         return f"{self.ds_class}{self.elements}"
@@ -865,19 +968,14 @@ class TreeNodeRepr(BaseRepr):
 
     @property
     def node_status(self):
-        if self.obj.alive:
-            status = self._ansi.color(f"alive", Ansi.GREEN)
-        else:
-            status = self._ansi.color(f"deleted", Ansi.RED)
-        return f"[status={status}]"
+        return _ALIVE_STATUS if self.obj.alive else _DELETED_STATUS
 
     @property
     def owner(self):
         instance = self.obj.tree_owner
-        owner_class = instance.__class__.__name__
-        memory_address = hex(id(instance))
+        # detached nodes have no owner - class name & address are only looked up when there is one to show.
         if instance is not None:
-            string = f"[owner={owner_class}: {memory_address}]"
+            string = f"[owner={type(instance).__name__}: {hex(id(instance))}]"
         else:
             string = f"[owner=None]"
         return string
@@ -886,15 +984,15 @@ class TreeNodeRepr(BaseRepr):
     def parent(self):
         parent = self.obj.parent
         if parent is not None:
-            color_parent = self._ansi.color(f"{parent.element}", Ansi.GREEN)
+            color_parent = Ansi.color(parent.element, Ansi.GREEN)
         else:
-            color_parent = self._ansi.color(f"None", Ansi.GREEN)
+            color_parent = _GREEN_NONE
         return f"[parent={color_parent}]"
 
     @property
     def element(self):
-        color_element = self._ansi.color(f"{self.obj.element}", Ansi.BLUE)
-        return f"{color_element}"
+        color_element = Ansi.color(self.obj.element, Ansi.BLUE)
+        return color_element
 
     @property
     def children(self):
@@ -906,24 +1004,26 @@ class TreeNodeRepr(BaseRepr):
         return f"{self.ds_memory_address}{self.ds_datatype}{self.node_status}{self.owner}{self.children}"
 
     def str_tnode(self):
-        return f"{self.element}"
+        return self.element
 
 class GenTreeRepr(BaseRepr):
 
     @property
     def tree_height(self):
-        if self.obj.root is None:
+        root = self.obj.root
+        if root is None:
             return f"[height=0]"
         else:
-            height = self.obj.height(self.obj.root)
+            height = self.obj.height(root)
         return f"[height={height}]"
 
     @property
     def tree_depth(self):
-        if self.obj.root is None:
+        root = self.obj.root
+        if root is None:
             return f"[depth=0]"
         else:
-            depth = self.obj.depth(self.obj.root)
+            depth = self.obj.depth(root)
         return f"[depth={depth}]"
 
     @property
@@ -945,44 +1045,55 @@ class GenTreeRepr(BaseRepr):
         adds connector symbols in front of each node value, depending on whether it is the last child "└─" or one of many "├─",
         every node adds either " " if parent is last child (no vertical bar needed) or "| " if parent is not last child (vertical bar continues)
         the node & its display symbols are appended to a list for the final string output.
+        node count & height are tallied during the same walk - no separate len() / height() traversals.
         """
 
-        total_tree_nodes = len(self.obj)
-        tree_height = self.obj.height(self.obj.root)
-
-        if self.obj.root is None:
+        root = self.obj.root
+        if root is None:
             return f"[🌳 empty tree]"
 
-        hierarchy = []
-        tree = [(self.obj.root, "", True)]  # (node, prefix, is_last)
-        # tree visualization construction loop (change to stack soon)
+        # root (depth = 0), we print 🌲 - emitted up front, so the loop below only ever sees descendants.
+        # slot 0 is reserved for the header - its stats are only known after the walk.
+        hierarchy = [None, f"🌲:{root.element}\n"]
+        total_tree_nodes = 1
+        tree_height = 0
+        tree = deque()  # (node, prefix, is_last, depth) - used as a stack
+        # list / stack methods & connector tables bound once - the loop body runs on locals only.
+        append, pop, push = hierarchy.append, tree.pop, tree.append
+        indicators, child_prefixes = _INDICATORS, _CHILD_PREFIXES
+
+        # children are pushed in reverse (left to right) - the last child goes first, flagged is_last, no per-child index test.
+        children = root.children
+        if children:
+            root_prefix = child_prefixes[True]
+            push((children[-1], root_prefix, True, 1))
+            for child in children[-2::-1]:
+                push((child, root_prefix, False, 1))
+
         while tree:
             # we traverse depth-first, which naturally fits a hierarchical print.
-            node, prefix, is_last = tree.pop()
+            node, prefix, is_last, depth = pop()
+            total_tree_nodes += 1
+            if depth > tree_height:
+                tree_height = depth
 
-            # root (depth = 0), we print 🌲
-            if node is self.obj.root:
-                indicator = "🌲:"
             # decides what connector symbol appears before the node value when printing the tree.
-            else: 
-                indicator = "" if prefix == "" else ("└─" if is_last else "├─")
-
-            # add to final string output
-            hierarchy.append(f"{prefix}{indicator}{str(node.element)}") 
-
-            # Build prefix for children - Vertical bars "│" are inherited from ancestors that are not last children
-            new_prefix = prefix + ("   " if is_last else "│  ")
-
-            # Iterates over the node’s children in reverse. (left to right) --- enumerate gives index i for calculating new prefix.
-            for i, child in enumerate(reversed(node.children)):
-                last_child = (i==0)
-                # Update ancestor flags: current node's is_last boolean affects all its children
-                tree.append((child, new_prefix, last_child))
-        # final string:
-        node_structure = "\n".join(hierarchy)
-        title = self._ansi.color(f"Tree: Depth First Search (DFS):", Ansi.GREEN)
-        stats = f"{self.total_nodes}{self.tree_height}"
-        return f"\n{title}\n{stats}\n{node_structure}\n"
+            append(f"{prefix}{indicators[is_last]}{node.element}\n")
+
+            children = node.children
+            if children:
+                # Build prefix for children - Vertical bars "│" are inherited from ancestors that are not last children
+                new_prefix = prefix + child_prefixes[is_last]
+                child_depth = depth + 1
+                push((children[-1], new_prefix, True, child_depth))
+                for child in children[-2::-1]:
+                    push((child, new_prefix, False, child_depth))
+
+        # final string: header + every line in a single join - no intermediate node_structure string.
+        title = _GEN_TREE_TITLE
+        stats = f"[total_nodes={total_tree_nodes}][height={tree_height}]"
+        hierarchy[0] = f"\n{title}\n{stats}\n"
+        return "".join(hierarchy)
 
 class BTreeNodeRepr(BaseRepr):
     """Node representation for Btree Nodes"""
@@ -997,15 +1108,17 @@ class BTreeNodeRepr(BaseRepr):
 
     @property
     def items(self) -> str:
-        combo = str(', '.join(f'{k}={v}' for k,v in zip(self.obj.keys, self.obj.elements)))
+        combo = ', '.join([f'{k}={v}' for k,v in zip(self.obj.keys, self.obj.elements)])
         return f"[{combo}]"
 
     @property
     def keys_range(self) -> str:
-        array_length = len(self.obj.keys)
-        begin = self.obj.keys[0] if not self.obj.keys.is_empty() else None
-        end = self.obj.keys[array_length-1] if not self.obj.keys.is_empty() else None
-        return f"[key range: {begin}|{end}]"
+        # one length check covers both ends - no is_empty() calls.
+        keys = self.obj.keys
+        array_length = len(keys)
+        if array_length == 0:
+            return "[key range: None|None]"
+        return f"[key range: {keys[0]}|{keys[array_length-1]}]"
 
     def str_btree_node(self):
         return f"{self.ds_class}{self.capacity}{self.keys_range}"
@@ -1110,7 +1223,7 @@ class TrieRepr(BaseRepr):
         dfs view of a trie data structure
         """
 
-        title = self._ansi.color(f"Trie:", Ansi.YELLOW)
+        title = _TRIE_TITLE
         stats = f"{self.word_count}{self.trie_height}"
 
         # stores the final console output.
@@ -1140,8 +1253,8 @@ class TrieRepr(BaseRepr):
             Collapses a linear chain of nodes (like a linked list) into a single label
             will branch if the node has more than 1 child, or if it is a terminal node for a word.
             """
-            # label represents the word string that will be printed in the console.
-            label = start_char
+            # label represents the word string that will be printed in the console - chars are joined once at the end.
+            chars = [start_char]
             node = start_node
 
             while True:
@@ -1150,10 +1263,10 @@ class TrieRepr(BaseRepr):
                     break
                 # * retrieves the only item in the children hashmap. and adds it to the label
                 (next_char, next_node) = next(iter(node.children.items()))
-                label += "-" + next_char
+                chars.append(next_char)
                 node = next_node    # traverse to the next node in the chain
 
-            return label, node
+            return "-".join(chars), node
 
         def _label_depth(label: str) -> int:
             """
@@ -1167,7 +1280,7 @@ class TrieRepr(BaseRepr):
             Extends the prefix to the next line down for console view.
             Utilizes the label depth to correctly indent the space for the trie branches.
             """
-            base = "  " if is_last else "|  "
+            base = _TRIE_CHILD_PREFIXES[is_last]
             indented_spacing = "  " * (depth - 1)
             return prefix + base + indented_spacing
 
@@ -1191,7 +1304,7 @@ class TrieRepr(BaseRepr):
             for i, (label, end_node) in enumerate(complete_words):
                 # determines which connector to use.
                 is_last = (i == (len(complete_words) - 1))
-                connector = "└─" if is_last else "├─"
+                connector = _INDICATORS[is_last]
 
                 # append to final console output
                 lines.append(prefix + connector + label)
@@ -1250,22 +1363,23 @@ class BinaryNodeRepr(TreeNodeRepr):
 
     @property
     def children(self):
-        if self.obj.left is not None:
-            left = self._ansi.color(f"{self.obj.left.element}", Ansi.GREEN)
+        # each child is read once - node attributes may be properties.
+        left, right = self.obj.left, self.obj.right
+        if left is not None:
+            left = Ansi.color(left.element, Ansi.GREEN)
         else:
-            left = self._ansi.color(f"None", Ansi.GREEN)
-        if self.obj.right is not None:
-            right = self._ansi.color(f"{self.obj.right.element}", Ansi.RED)
+            left = _GREEN_NONE
+        if right is not None:
+            right = Ansi.color(right.element, Ansi.RED)
         else:
-            right = self._ansi.color(f"None", Ansi.RED)
+            right = _RED_NONE
         return f"[children: L={left}, R={right}]"
 
     @property
     def sibling(self):
-        if self.obj.sibling is not None:
-            sib = self.obj.sibling.element
-        else:
-            sib = "None"
+        # sibling is derived from the parent on every read - looked up once.
+        sibling = self.obj.sibling
+        sib = sibling.element if sibling is not None else "None"
         return f"[sibling={sib}]"
 
     def str_binary_node(self):
@@ -1287,10 +1401,11 @@ class BinaryTreeRepr(BaseRepr):
 
     @property
     def tree_depth(self):
-        if self.obj.root is None:
+        root = self.obj.root
+        if root is None:
             return f"[depth=0]"
         else:
-            depth = self.obj.depth(self.obj.root)
+            depth = self.obj.depth(root)
         return f"[depth={depth}]"
 
     @property
@@ -1298,56 +1413,25 @@ class BinaryTreeRepr(BaseRepr):
         number = len(self.obj)
         return f"[total_nodes={number}]"
 
-    def str_binary_tree(self):
-        """binary tree __str__"""
-        total_tree_nodes = len(self.obj)
-        tree_height = self.obj.height()
+    @property
+    def tree_stats(self):
+        """total_nodes & height from a single walk of the tree."""
+        number, height = _count_and_height(self.obj.root)
+        return f"[total_nodes={number}][height={height}]"
+
+    def _iter_lines(self):
+        """lazily yields (depth, prefix, indicator, value) for every node in render order - callers can stream or buffer it."""
+        return _iter_binary_lines(self.obj.root, _element_label, _BINARY_CONNECTORS)
 
+    def str_binary_tree(self):
+        """binary tree __str__ - node count & height are tallied while the lines are consumed."""
         if self.obj.root is None:
             return f"[🌳 empty tree]"
-
-        hierarchy = []
-        tree = [(self.obj.root, "", True)]  # (node, prefix, is_last)
-
-        while tree:
-            # we traverse depth-first, which naturally fits a hierarchical print.
-            node, prefix, is_last = tree.pop()
-
-            # root (depth = 0), we print nothing
-            if node is self.obj.root:
-                indicator = ""
-            # decides what connector symbol appears before the node value when printing the tree.
-            else:
-                indicator = "" if prefix == "" else ("└─" if is_last else "├─")
-
-            # add to final string output
-            hierarchy.append(f"{prefix}{indicator}{str(node.element)}")
-
-            # Build prefix for children - Vertical bars "│" are inherited from ancestors that are not last children
-            new_prefix = prefix + ("   " if is_last else "│  ")
-
-            # Iterates over the node’s children in reverse. (left to right) --- enumerate gives index i for calculating new prefix.
-            # ! pack into tuples and then into a list to iterate over. (for binary trees)
-            children = []
-            if node.right is not None:
-                children.append((node.right, True))
-            if node.left is not None:
-                children.append((node.left, False))
-
-            for child, last_flag in children:
-                # Update ancestor flags: current node's is_last boolean affects all its children
-                if child is not None:
-                    tree.append((child, new_prefix, last_flag))
-
-        # final string:
-        node_structure = "\n".join(hierarchy)
-        title = self._ansi.color(f"Tree: Depth First Search (DFS):🌲", Ansi.GREEN)
-        stats = f"{self.total_nodes}{self.tree_height}"
-        return f"\n{title}\n{stats}\n{node_structure}\n"
+        return _render_dfs(self._iter_lines(), _BINARY_TREE_TITLE)
 
     def repr_binary_tree(self):
         """__repr__ for binary tree"""
-        return f"{self.ds_memory_address}{self.ds_datatype}{self.total_nodes}{self.tree_height}{self.tree_depth}"
+        return f"{self.ds_memory_address}{self.ds_datatype}{self.tree_stats}{self.tree_depth}"
 
 class SegmentTreeRepr(BaseRepr):
 
@@ -1370,7 +1454,7 @@ class SegmentTreeRepr(BaseRepr):
                 return []
 
             lines = []
-            connector = "├──" if is_left else "└──"
+            connector = _SEGMENT_CONNECTORS[is_left]
             # the left and right child nodes and the aggregated value (sum, min, max etc)
             segment = f"[{left}, {right}] = {tree[index]}" if not left == right else f"{tree[index]}"
 
@@ -1382,7 +1466,7 @@ class SegmentTreeRepr(BaseRepr):
 
             # * divide & conquer - split the curent segment in half.
             mid = (left + right) // 2
-            next_indent = indent + ("│  " if is_left and index != 0 else "   ")
+            next_indent = indent + _CHILD_PREFIXES[not is_left or index == 0]
 
             # * recursive aggregration: Uses 0-based heap indexing
             lines += _recursively_create_structure(tree, left, mid, 2*index+1, next_indent, True)
@@ -1391,7 +1475,7 @@ class SegmentTreeRepr(BaseRepr):
 
         lines = _recursively_create_structure(self.obj.tree, 0, self.obj.array_length-1)
         complete_structure = f"\n".join(lines)
-        title = self._ansi.color(f"Segment Tree:🌲", Ansi.BLUE)
+        title = _SEGMENT_TREE_TITLE
         stats = f"{self.ds_class}{self.tree_size}{self.operator_type}"
         return f"\n{title}\n{stats}\n{complete_structure}"
 
@@ -1405,7 +1489,7 @@ class SegmentTreeRepr(BaseRepr):
                 return []
 
             lines = []
-            connector = "├──" if is_left else "└──"
+            connector = _SEGMENT_CONNECTORS[is_left]
             # the left and right child nodes and the aggregated value (sum, min, max etc)
             segment = f"[{left}, {right}] = {tree[index]}" if not left == right else f"{tree[index]}"
 
@@ -1420,7 +1504,7 @@ class SegmentTreeRepr(BaseRepr):
 
             # * divide & conquer - split the curent segment in half.
             mid = (left + right) // 2
-            next_indent = indent + ("│  " if is_left and index != 0 else "   ")
+            next_indent = indent + _CHILD_PREFIXES[not is_left or index == 0]
 
             # * recursive aggregration: Uses 0-based heap indexing
             lines += _recursively_create_structure(tree, left, mid, 2*index+1, next_indent, True)
@@ -1429,7 +1513,7 @@ class SegmentTreeRepr(BaseRepr):
 
         lines = _recursively_create_structure(self.obj.tree, 0, self.obj.array_length-1)
         complete_structure = f"\n".join(lines)
-        title = self._ansi.color(f"Segment Tree:🌲", Ansi.BLUE)
+        title = _SEGMENT_TREE_TITLE
         stats = f"{self.ds_class}{self.tree_size}{self.operator_type}"
         return f"\n{title}\n{stats}\n{complete_structure}"
 
@@ -1443,7 +1527,7 @@ class SegmentTreeRepr(BaseRepr):
                 return []
 
             lines = []
-            connector = "├──" if is_left else "└──"
+            connector = _SEGMENT_CONNECTORS[is_left]
             # the left and right child nodes and the aggregated value (sum, min, max etc)
             min_arr = self.obj.min_array[index]
             max_arr = self.obj.max_array[index]
@@ -1460,7 +1544,7 @@ class SegmentTreeRepr(BaseRepr):
 
             # * divide & conquer - split the curent segment in half.
             mid = (left + right) // 2
-            next_indent = indent + ("│  " if is_left and index != 0 else "   ")
+            next_indent = indent + _CHILD_PREFIXES[not is_left or index == 0]
 
             # * recursive aggregration: Uses 0-based heap indexing
             lines += _recursively_create_structure(left, mid, 2*index+1, next_indent, True)
@@ -1469,7 +1553,7 @@ class SegmentTreeRepr(BaseRepr):
 
         lines = _recursively_create_structure(0, self.obj.array_length-1)
         complete_structure = f"\n".join(lines)
-        title = self._ansi.color(f"Segment Tree:🌲", Ansi.BLUE)
+        title = _SEGMENT_TREE_TITLE
         stats = f"{self.ds_class}{self.tree_size}{self.operator_type}"
         return f"\n{title}\n{stats}\n{complete_structure}"
 
@@ -1518,14 +1602,15 @@ class BSTNodeRepr(TreeNodeRepr):
 
     @property
     def children(self):
-        if self.obj.left is not None:
-            left = self._ansi.color(f"{self.obj.left.element}", Ansi.GREEN)
+        left, right = self.obj.left, self.obj.right
+        if left is not None:
+            left = Ansi.color(left.element, Ansi.GREEN)
         else:
-            left = self._ansi.color(f"None", Ansi.GREEN)
-        if self.obj.right is not None:
-            right = self._ansi.color(f"{self.obj.right.element}", Ansi.RED)
+            left = _GREEN_NONE
+        if right is not None:
+            right = Ansi.color(right.element, Ansi.RED)
         else:
-            right = self._ansi.color(f"None", Ansi.RED)
+            right = _RED_NONE
         return f"[children: L={left}, R={right}]"
 
     @property
@@ -1535,7 +1620,7 @@ class BSTNodeRepr(TreeNodeRepr):
         return f"{elem} [k:{key_value}]"
 
     def str_bst_node(self):
-        return f"{self.element}"
+        return self.element
 
     def repr_bst_node(self):
         return f"{self.ds_memory_address}{self.ds_datatype}{self.children}{self.node_status}{self.owner}"
@@ -1555,56 +1640,27 @@ class BSTRepr(BaseRepr):
         number = len(self.obj)
         return f"[total_nodes={number}]"
 
+    @property
+    def tree_stats(self):
+        """total_nodes & height from a single walk of the tree."""
+        number, height = _count_and_height(self.obj.root)
+        return f"[total_nodes={number}][height={height}]"
+
+    def _iter_lines(self):
+        """lazily yields (depth, prefix, indicator, label) for every node in render order - callers can stream or buffer it."""
+        # ! leaves use a fixed connector (see _BST_CONNECTORS) - this is the code that is modified for BST
+        return _iter_binary_lines(self.obj.root, _key_element_label, _BST_CONNECTORS)
+
     def str_bst(self):
         """ __str__ for binary search tree - slight modifications to the code used for other trees."""
-        total_tree_nodes = len(self.obj)
-        tree_height = self.obj.height()
         if self.obj.root is None:
             return f"< 🌳 empty tree>"
-
-        hierarchy = []
-        tree = [(self.obj.root, "", True)]  # (node, prefix, is_last)
-
-        while tree:
-            # we traverse depth-first, which naturally fits a hierarchical print.
-            node, prefix, is_last = tree.pop()
-
-            # root (depth = 0), we print 🌲
-            if node is self.obj.root:
-                indicator = ""
-            # decides what connector symbol appears before the node value when printing the tree.
-            else:
-                # ! this is the code that is modified for BST
-                indicator = "└─ " if not (node.left or node.right) else ("└─ " if is_last else "├─ ")
-
-            # add to final string output
-            node_string = f"{node.key}: {node.element}"
-            hierarchy.append(f"{prefix}{indicator}{str(node_string)}")
-
-            # Build prefix for children - Vertical bars "│" are inherited from ancestors that are not last children
-            new_prefix = prefix + ("   " if is_last else "│  ")
-
-            # Iterates over the node’s children in reverse. (left to right) --- enumerate gives index i for calculating new prefix.
-            children = []
-            if node.right is not None:
-                children.append((node.right, True))
-            if node.left is not None:
-                children.append((node.left, False))
-
-            for child, last_flag in children:
-                # Update ancestor flags: current node's is_last boolean affects all its children
-                if child is not None:
-                    tree.append((child, new_prefix, last_flag))
-
-        # final string:
-        node_structure = "\n".join(hierarchy)
-        title = self._ansi.color(f"Binary Search Tree: Inorder Traversal:🌲", Ansi.GREEN)
-        stats = f"{self.total_nodes}{self.tree_height}"
-        return f"\n{title}\n{stats}\n{node_structure}\n"
+        # node count & height are tallied while the lines are consumed - no separate len() / height() traversals.
+        return _render_dfs(self._iter_lines(), _BST_TITLE)
 
     def repr_bst(self):
         """ __repr__ for binary search tree"""
-        return f"{self.ds_memory_address}{self.ds_datatype}{self.total_nodes}{self.tree_height}"
+        return f"{self.ds_memory_address}{self.ds_datatype}{self.tree_stats}"
 
 class AVLNodeRepr(BSTNodeRepr):
 
@@ -1623,7 +1679,7 @@ class AVLNodeRepr(BSTNodeRepr):
         return f"[is_balanced?={self.obj.unbalanced}]"
 
     def str_avl_node(self):
-        return f"{self.element}"
+        return self.element
 
     def repr_avl_node(self):
         return f"{self.ds_memory_address}{self.ds_datatype}{self.check_balance}{self.balance}{self.node_height}{self.children}{self.node_status}{self.owner}"
@@ -1643,54 +1699,15 @@ class AVLTreeRepr(BSTRepr):
 
     def str_avl(self):
         """ __str__ for binary search tree - slight modifications to the code used for other trees."""
-        total_tree_nodes = len(self.obj)
-        tree_height = self.obj.height()
         if self.obj.root is None:
             return f"< 🌳 empty tree>"
 
-        hierarchy = []
-        tree = [(self.obj.root, "", True)]  # (node, prefix, is_last)
-
-        while tree:
-            # we traverse depth-first, which naturally fits a hierarchical print.
-            node, prefix, is_last = tree.pop()
-
-            # root (depth = 0), we print 🌲
-            if node is self.obj.root:
-                indicator = ""
-            # decides what connector symbol appears before the node value when printing the tree.
-            else:
-                # ! this is the code that is modified for BST
-                indicator = "└─ " if not (node.left or node.right) else ("└─ " if is_last else "├─ ")
-
-            # add to final string output
-            node_string = f"{node.key}: {node.element}"
-            hierarchy.append(f"{prefix}{indicator}{str(node_string)}")
-
-            # Build prefix for children - Vertical bars "│" are inherited from ancestors that are not last children
-            new_prefix = prefix + ("   " if is_last else "│  ")
-
-            # Iterates over the node’s children in reverse. (left to right) --- enumerate gives index i for calculating new prefix.
-            children = []
-            if node.right is not None:
-                children.append((node.right, True))
-            if node.left is not None:
-                children.append((node.left, False))
-
-            for child, last_flag in children:
-                # Update ancestor flags: current node's is_last boolean affects all its children
-                if child is not None:
-                    tree.append((child, new_prefix, last_flag))
-
-        # final string:
-        node_structure = "\n".join(hierarchy)
-        title = self._ansi.color(f"AVL Tree: 🌲", Ansi.GREEN)
-        stats = f"{self.total_nodes}{self.tree_height}{self.unbalanced}{self.max_bf}"
-        return f"\n{title}\n{stats}\n{node_structure}\n"
+        # same walk as the bst render - node count & height are tallied from the lines, no separate stats walk.
+        return _render_dfs(self._iter_lines(), _AVL_TITLE, f"{self.unbalanced}{self.max_bf}")
 
     def repr_avl(self):
         """ __repr__ for AVL Tree"""
-        return f"{self.ds_memory_address}{self.ds_datatype}{self.total_nodes}{self.tree_height}"
+        return f"{self.ds_memory_address}{self.ds_datatype}{self.tree_stats}"
 
 class RedBlackNodeRepr(BSTNodeRepr):
 
@@ -1720,6 +1737,12 @@ class RedBlackTreeRepr(BSTRepr):
     def __init__(self, obj) -> None:
         super().__init__(obj)
 
+    @property
+    def tree_stats(self):
+        """total_nodes & height from a single walk of the tree - NIL sentinels are not counted."""
+        number, height = _count_and_height(self.obj.root, self.obj.NIL)
+        return f"[total_nodes={number}][height={height}]"
+
     @property
     def black_property(self):
         result = self.obj.is_black_property
@@ -1730,60 +1753,19 @@ class RedBlackTreeRepr(BSTRepr):
         result = self.obj.is_red_property
         return f"[red_property={result}]"
 
+    def _iter_lines(self):
+        """lazily yields (depth, prefix, indicator, label) for every node in render order - NIL sentinels are never yielded."""
+        # NIL sentinels are the empty-child marker here. the red black render has always drawn its root with the last-child connector.
+        return _iter_binary_lines(self.obj.root, _red_black_label, _BST_CONNECTORS, self.obj.NIL, root_indicator=_BST_INDICATORS[True])
+
     def str_redblack_tree(self):
         """ __str__ for binary search tree - slight modifications to the code used for other trees."""
-        total_tree_nodes = len(self.obj)
-        tree_height = self.obj.height()
         if self.obj.root == self.obj.NIL:
             return f"[🌳 empty Red Black Tree]"
+        return _render_dfs(self._iter_lines(), _RED_BLACK_TITLE, f"{self.black_property}{self.red_property}")
 
-        hierarchy = []
-        tree = [(self.obj.root, "", True)]  # (node, prefix, is_last)
-
-        while tree:
-            # we traverse depth-first, which naturally fits a hierarchical print.
-            node, prefix, is_last = tree.pop()
-
-            # root (depth = 0), we print 🌲
-            if node is self.obj.root:
-                indicator = ""
-
-            # ! skip sentinels (in red black tree)
-            if node == self.obj.NIL:
-                continue
-
-            # decides what connector symbol appears before the node value when printing the tree.
-            else:
-                # ! this is the code that is modified for BST
-                indicator = "└─ " if not (node.left or node.right) else ("└─ " if is_last else "├─ ")
-
-            # add to final string output
-            node_string = f"{node.key}: {node.element} ({f'r' if node.is_red else 'b'})"
-            hierarchy.append(f"{prefix}{indicator}{str(node_string)}")
-
-            # Build prefix for children - Vertical bars "│" are inherited from ancestors that are not last children
-            new_prefix = prefix + ("   " if is_last else "│  ")
-
-            # Iterates over the node’s children in reverse. (left to right) --- enumerate gives index i for calculating new prefix.
-            children = []
-            if node.right is not None:
-                children.append((node.right, True))
-            if node.left is not None:
-                children.append((node.left, False))
-
-            for child, last_flag in children:
-                # Update ancestor flags: current node's is_last boolean affects all its children
-                if child is not None:
-                    tree.append((child, new_prefix, last_flag))
-
-        # final string:
-        node_structure = "\n".join(hierarchy)
-        title = self._ansi.color(f"Red Black Tree: ", Ansi.RED)
-        stats = f"{self.total_nodes}{self.tree_height}{self.black_property}{self.red_property}"
-        return f"\n{title}\n{stats}\n{node_structure}\n"
-    
     def repr_redblack_tree(self):
-        return f"{self.ds_memory_address}{self.ds_datatype}{self.total_nodes}{self.tree_height}{self.black_property}{self.red_property}"
+        return f"{self.ds_memory_address}{self.ds_datatype}{self.tree_stats}{self.black_property}{self.red_property}"
 
 # endregion
 
@@ -1822,7 +1804,7 @@ class DisjointSetForestRepr(BaseRepr):
 
     @property
     def reps(self) -> str:
-        return f"[representatives={', '.join(f'{i.element}[r={i.rank}]' for i in self.obj.representatives)}]"
+        return f"[representatives={', '.join([f'{i.element}[r={i.rank}]' for i in self.obj.representatives])}]"
 
     def str_disjoint_set_forest(self):
         return f"{self.ds_class}{self.reps}"
@@ -1845,23 +1827,20 @@ class VertexRepr(BaseRepr):
     @property
     def vert_id(self) -> str:
         """uses insert order as an id for the vert."""
-        label = self.obj.name
-        insert_number = self.obj.insert_order
-
-        # insertion number logic
+        vertex = self.obj
+        label = vertex.name
+        insert_number = vertex.insert_order
+        # unset insertion number shows as "_" - the id string is formatted in one go.
         if insert_number is None:
-            insert_number = f"[_]"
-        else:
-            insert_number = f"[{insert_number}]"
+            insert_number = "_"
 
         # label replaces insertion number
         if label is not None:
-            return f"{insert_number}id={label}"
-        else:
-            return f"{insert_number}"
+            return f"[{insert_number}]id={label}"
+        return f"[{insert_number}]"
 
     def str_vertex(self):
-        return f"{self.element}"
+        return self.element
 
     def repr_vertex(self):
         return f"{self.ds_class}{self.element}"
@@ -1876,15 +1855,14 @@ class EdgeRepr(BaseRepr):
 
     @property
     def edge_id(self) -> str:
-        origin = self.obj.origin.element
-        destination = self.obj.destination.element
-        return f"{origin} <{self.obj.element}> {destination}"
+        edge = self.obj
+        return f"{edge.origin.element} <{edge.element}> {edge.destination.element}"
 
     def repr_edge(self):
         return f"{self.ds_class}{self.edge_id}"
 
     def str_edge(self):
-        return f"{self.edge_id}"
+        return self.edge_id
 
 class GraphRepr(BaseRepr):
     """representation for Graphs"""
@@ -1911,14 +1889,13 @@ class GraphRepr(BaseRepr):
 
     @property
     def adj_map(self) -> str:
-        adjacency_map = self.obj.view_adjacency_map
+        # the map view walks every vertex & edge - only built when there is something to show, and only once.
         if self.obj.vertex_count == 0:
             return f"Graph Adjacency Map: Empty Graph..."
-        else:
-            return self.obj.view_adjacency_map
+        return self.obj.view_adjacency_map
 
     def str_graph(self):
-        return f"{self.adj_map}"
+        return self.adj_map
 
     def repr_graph(self):
         return f"{self.ds_memory_address}{self.ds_datatype}{self.directed}{self.vertex_count}{self.edge_count}"
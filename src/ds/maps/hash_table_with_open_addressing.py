@@ -198,7 +198,7 @@ class HashTableOA(MapADT[T, K], CollectionADT[T], Generic[T, K]):
     # region stats:
     @property
     def table_items(self) -> str:
-        return f"{str(', '.join(f'{k}: {v}' for k, v in self.items()))}"
+        return ', '.join([f'{k}: {v}' for k, v in self.items()])
 
     @property
     def capacity_string(self) -> str:
@@ -196,36 +196,29 @@ class MapUtils:
     def load_factor_stats_OA_indicator(self, color: bool = True):
         """changes the color of the load factor text depending on a threshold -- and provides a symbol for easy identification"""
         # Load Factor:
-        load_factor_emoji = LOAD_FACTOR_SYMBOL
-        if self.obj.current_load_factor < self.obj.max_load_factor:
-            color_load_factor = self._ansi.color(f"{self.obj.current_load_factor:.2f}", self._ansi.GREEN)
-        else: 
-            color_load_factor = self._ansi.color(f"{self.obj.current_load_factor:.2f}", self._ansi.RED)
-        load_factor_string = f"{load_factor_emoji} : {color_load_factor}"
-        load_factor_nocolor = f"{load_factor_emoji} : {self.obj.current_load_factor:.2f}"
-        return load_factor_string if color else load_factor_nocolor
+        # the stat is read & formatted once - only the requested (colored or plain) string is built.
+        load_factor = self.obj.current_load_factor
+        load_factor_text = f"{load_factor:.2f}"
+        if not color:
+            return f"{LOAD_FACTOR_SYMBOL} : {load_factor_text}"
+        color_code = self._ansi.GREEN if load_factor < self.obj.max_load_factor else self._ansi.RED
+        return f"{LOAD_FACTOR_SYMBOL} : {self._ansi.color(load_factor_text, color_code)}"
 
     def collisions_stats_OA_indicator(self, color: bool = True):
         """changes the color of the collisions text depending on a threshold -- and provides a symbol for easy identification"""
-        collisions_emojis = COLLISIONS_SYMBOL
-        if self.obj.collisions_ratio < self.obj.collisions_threshold - 0.05:
-            color_collisions = self._ansi.color(f"{self.obj.current_collisions}", self._ansi.GREEN)  
-        else: 
-            color_collisions = self._ansi.color(f"{self.obj.current_collisions}", self._ansi.RED)
-        total_collisions_string = f"{collisions_emojis} : {color_collisions}"
-        total_coll_nocolor = f"{collisions_emojis} : {self.obj.current_collisions}"
-        return total_collisions_string if color else total_coll_nocolor
+        collisions = self.obj.current_collisions
+        if not color:
+            return f"{COLLISIONS_SYMBOL} : {collisions}"
+        color_code = self._ansi.GREEN if self.obj.collisions_ratio < self.obj.collisions_threshold - 0.05 else self._ansi.RED
+        return f"{COLLISIONS_SYMBOL} : {self._ansi.color(f'{collisions}', color_code)}"
 
     def tombstone_stats_OA_indicator(self, color: bool = True):
         """changes the color of the tombstone stats depending on a threshold -- and provides a symbol for easy identification"""
-        tombstone_emojis = TOMBSTONE_MARKER
-        if  self.obj.tombstones_ratio < self.obj.tombstones_threshold - 0.05:
-            color_tombstones = self._ansi.color(f"{self.obj.current_tombstones}",self._ansi.GREEN)  
-        else: 
-            color_tombstones = self._ansi.color(f"{self.obj.current_tombstones}", self._ansi.RED)
-        tombstone_string = f"{tombstone_emojis}  : {color_tombstones}"
-        tombstones_nocolor = f"{tombstone_emojis}  : {self.obj.current_tombstones}"
-        return tombstone_string if color else tombstones_nocolor
+        tombstones = self.obj.current_tombstones
+        if not color:
+            return f"{TOMBSTONE_MARKER}  : {tombstones}"
+        color_code = self._ansi.GREEN if self.obj.tombstones_ratio < self.obj.tombstones_threshold - 0.05 else self._ansi.RED
+        return f"{TOMBSTONE_MARKER}  : {self._ansi.color(f'{tombstones}', color_code)}"
 
     def rehash_stats_OA_indicator(self):
         """rehash indicator with symbol"""
@@ -235,25 +228,21 @@ class MapUtils:
 
     def probe_stats_OA_indicator(self, color: bool = True):
         """probe stats with symbol -- indicates the current probe length. (amount of slots traversed till an empty slot is found.)"""
-        probe_emoji = PROBE_SYMBOL
-        if self.obj.probe_ratio < self.obj.probe_threshold - 0.05:
-            color_probes = self._ansi.color(f"{self.obj.current_probes}", self._ansi.GREEN)
-        else: 
-            color_probes = self._ansi.color(f"{self.obj.current_probes}", self._ansi.RED)
-        probes_string = f"{probe_emoji} : {color_probes}"
-        probes_nocolor = f"{probe_emoji} : {self.obj.current_probes}"
-        return probes_string if color else probes_nocolor
+        probes = self.obj.current_probes
+        if not color:
+            return f"{PROBE_SYMBOL} : {probes}"
+        color_code = self._ansi.GREEN if self.obj.probe_ratio < self.obj.probe_threshold - 0.05 else self._ansi.RED
+        return f"{PROBE_SYMBOL} : {self._ansi.color(f'{probes}', color_code)}"
 
     def average_probe_length_stats_OA_indicator(self, color: bool = True):
         """shows the average probe number (as a float) -- with a symbol and color indicator for danger levels."""
-        average_probe_emoji = AVERAGE_PROBES_SYMBOL
-        if self.obj.average_probe_length < 3:
-            color_avg_probe = self._ansi.color(f"{self.obj.average_probe_length:.2f}" , self._ansi.GREEN)  
-        else: 
-            color_avg_probe = self._ansi.color(f"{self.obj.average_probe_length:.2f}", self._ansi.RED)
-        avg_probes_string = f"{average_probe_emoji} : {color_avg_probe}"
-        avg_probes_nocolor = f"{average_probe_emoji} : {self.obj.average_probe_length:.2f}"
-        return avg_probes_string if color else avg_probes_nocolor
+        # average_probe_length is a computed property - read it once instead of three times.
+        average_probe_length = self.obj.average_probe_length
+        avg_probe_text = f"{average_probe_length:.2f}"
+        if not color:
+            return f"{AVERAGE_PROBES_SYMBOL} : {avg_probe_text}"
+        color_code = self._ansi.GREEN if average_probe_length < 3 else self._ansi.RED
+        return f"{AVERAGE_PROBES_SYMBOL} : {self._ansi.color(avg_probe_text, color_code)}"
 
     def _populate_OA_hash_table_view(self):
         """
@@ -163,7 +163,6 @@ class DisjointSetForest(DisjointSetADT[T], CollectionADT[T]):
         # * find and validate the representative (node)
         rep_node = self.find_representative(representative)
         set_members = self.get_members(representative)
-        bush_structure = ""
 
         # validation
         if rep_node is None:
@@ -197,8 +196,10 @@ class DisjointSetForest(DisjointSetADT[T], CollectionADT[T]):
 
         # * main case: return final bush construction
         tree_size_string = f"[tree_size={tree_size}]"
+        bush_lines = []
         while child_strings_stack:
-            bush_structure += child_strings_stack.pop() + "\n"
+            bush_lines.append(child_strings_stack.pop())
+        bush_structure = "\n".join(bush_lines) + "\n"
         stats = f"{tree_size_string}{members_string}"
         return f"\n{title}\n{stats}\n{rep_string}\n{bush_structure}\n"
 
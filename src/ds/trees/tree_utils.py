@@ -1487,15 +1487,12 @@ class TreeUtils:
 
         while tree:
             level_size = len(tree)
-            level_string = f"Level {level}:[{level_size}]: "
+            key_ranges = []
 
-            for i in range(level_size):
+            for _ in range(level_size):
                 node = tree.remove_front()
                 key_range = f"[{node.keys[0]}|{node.keys[node.num_keys-1]}[{node.num_keys}]]" if node.num_keys > 0 else "[]"
-                if i == level_size -1:
-                    level_string += key_range 
-                else:
-                    level_string += key_range + ", "
+                key_ranges.append(key_range)
 
                 
                 if not node.is_leaf:
@@ -1503,6 +1500,8 @@ class TreeUtils:
                         child = node.children[i]
                         tree.add_rear(child)
                         
+            # the level line is built once from its key ranges - no per-node string concatenation.
+            level_string = f"Level {level}:[{level_size}]: {', '.join(key_ranges)}"
             hierarchy.append(level_string)
             level += 1
 
@@ -1710,16 +1709,13 @@ class TreeUtils:
 
         while tree:
             level_size = len(tree)
-            level_string = f"Level {level}:[{level_size}]: "
+            key_ranges = []
 
-            for i in range(level_size):
+            for _ in range(level_size):
                 node = tree.remove_front()
                 node = self.obj.convert_page_id_to_node(node)
                 key_range = f"[{node.keys[0]}|{node.keys[node.num_keys-1]}[{node.num_keys}]]" if node.num_keys > 0 else "[]"
-                if i == level_size -1:
-                    level_string += key_range 
-                else:
-                    level_string += key_range + ", "
+                key_ranges.append(key_range)
 
                 
                 if not node.is_leaf:
@@ -1727,6 +1723,7 @@ class TreeUtils:
                         child = self.obj.convert_page_id_to_node(node.children[i])
                         tree.add_rear(child)
                         
+            level_string = f"Level {level}:[{level_size}]: {', '.join(key_ranges)}"
             hierarchy.append(level_string)
             level += 1
 